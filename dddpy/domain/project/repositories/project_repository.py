@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from sqlalchemy.orm import Session
 
 from dddpy.domain.project.entities import Project
-from dddpy.domain.project.value_objects import ProjectId
+from dddpy.domain.project.value_objects import ProjectId, ProjectName
 
 
 class ProjectRepository(ABC):
@@ -22,6 +22,10 @@ class ProjectRepository(ABC):
     def find_all(self, limit: int | None = None) -> list[Project]:
         """Get all Projects with optional limit"""
 
+    @abstractmethod
+    def exists_by_name(self, name: ProjectName) -> bool:
+        """Check whether a Project with the given name exists"""
+
     @abstractmethod
     def delete(self, project_id: ProjectId) -> None:
         """Delete a Project by ID"""
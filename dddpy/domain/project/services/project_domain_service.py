@@ -19,8 +19,7 @@ class ProjectDomainService:
         name: ProjectName, repository: 'ProjectRepository'
     ) -> bool:
         """既存のプロジェクト名と重複しないか検証する"""
-        existing_projects = repository.find_all()
-        return all(p.name != name for p in existing_projects)
+        return not repository.exists_by_name(name)
 
     @staticmethod
     def can_delete_project(project: 'Project') -> bool:
@@ -88,6 +88,10 @@ class DomainEventPublisher:
         """Get all published events."""
         return self._events.copy()
 
+    def pending_count(self) -> int:
+        """Get the number of published events without copying them."""
+        return len(self._events)
+
     def clear_events(self) -> None:
         """Clear all published events."""
         self._events.clear()
@@ -15,7 +15,7 @@ class ProjectModel(Base):
 
     __tablename__ = 'project'
     id: Mapped[UUID] = mapped_column(primary_key=True, autoincrement=False)
-    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    name: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
     description: Mapped[str] = mapped_column(String(1000), nullable=True)
     created_at: Mapped[int] = mapped_column(index=True, nullable=False)
     updated_at: Mapped[int] = mapped_column(index=True, nullable=False)
@@ -1,17 +1,22 @@
 """SQLite implementation of Project repository."""
 
+from uuid import UUID
+
 from sqlalchemy import desc
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm.session import Session
 
 from dddpy.domain.project.entities import Project
 from dddpy.domain.project.repositories import ProjectRepository
-from dddpy.domain.project.value_objects import ProjectId
+from dddpy.domain.project.value_objects import ProjectId, ProjectName
 from dddpy.infrastructure.sqlite.project.project_mapper import ProjectMapper
 from dddpy.infrastructure.sqlite.project.project_model import ProjectModel
 from dddpy.infrastructure.sqlite.todo.todo_model import TodoModel
 from dddpy.infrastructure.sqlite.todo.todo_mapper import TodoMapper
 
+# Well below SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999 before 3.32)
+_MAX_IDS_PER_QUERY = 500
+
 
 class ProjectRepositoryImpl(ProjectRepository):
     """SQLite implementation of Project repository interface."""
@@ -43,15 +48,41 @@ class ProjectRepositoryImpl(ProjectRepository):
             query = query.limit(limit)
 
         project_rows = query.all()
-
-        projects = []
-        for project_row in project_rows:
+        if not project_rows:
+            return []
+
+        # Load the fetched projects' todos by their ids (not by re-running the
+        # project select, which could see projects committed in between); the
+        # id list is chunked to stay below SQLite's bind-parameter limit
+        project_ids = [project_row.id for project_row in project_rows]
+        todo_rows_by_project: dict[UUID, list[TodoModel]] = {
+            project_id: [] for project_id in project_ids
+        }
+        for start in range(0, len(project_ids), _MAX_IDS_PER_QUERY):
             todo_rows = (
-                self.session.query(TodoModel).filter_by(project_id=project_row.id).all()
+                self.session.query(TodoModel)
+                .filter(
+                    TodoModel.project_id.in_(
+                        project_ids[start : start + _MAX_IDS_PER_QUERY]
+                    )
+                )
+                .all()
             )
-            projects.append(ProjectMapper.to_entity(project_row, todo_rows))
-
-        return projects
+            for todo_row in todo_rows:
+                todo_rows_by_project[todo_row.project_id].append(todo_row)
+
+        return [
+            ProjectMapper.to_entity(project_row, todo_rows_by_project[project_row.id])
+            for project_row in project_rows
+        ]
+
+    def exists_by_name(self, name: ProjectName) -> bool:
+        """Check whether a Project with the given name exists."""
+        # Only the primary key is selected; no Project/Todo rows are hydrated
+        return (
+            self.session.query(ProjectModel.id).filter_by(name=name.value).first()
+            is not None
+        )
 
     def save(self, project: Project) -> None:
         """Save a Project and all its todos."""
@@ -69,43 +100,37 @@ class ProjectRepositoryImpl(ProjectRepository):
             # Create new project
             self.session.add(project_dto)
 
+        # Load the project's current todos in one query instead of one per todo
+        existing_todos = {
+            todo_row.id: todo_row
+            for todo_row in self.session.query(TodoModel)
+            .filter_by(project_id=project.id.value)
+            .all()
+        }
+
         # Save all todos using TodoMapper
+        new_todos = []
         for todo in project.todos:
             todo_dto = TodoMapper.from_entity(todo)
-            try:
-                existing_todo = (
-                    self.session.query(TodoModel).filter_by(id=todo.id.value).one()
-                )
-                # Update existing todo
-                existing_todo.project_id = todo_dto.project_id
-                existing_todo.title = todo_dto.title
-                existing_todo.description = todo_dto.description
-                existing_todo.status = todo_dto.status
-                existing_todo.dependencies = todo_dto.dependencies
-                existing_todo.updated_at = todo_dto.updated_at
-                existing_todo.completed_at = todo_dto.completed_at
-            except NoResultFound:
+            existing_todo = existing_todos.pop(todo.id.value, None)
+            if existing_todo is None:
                 # Create new todo
-                self.session.add(todo_dto)
+                new_todos.append(todo_dto)
+                continue
 
-        # Remove todos that are no longer in the project
-        existing_todo_ids = {todo.id.value for todo in project.todos}
-        if existing_todo_ids:
-            todos_to_delete = (
-                self.session.query(TodoModel)
-                .filter_by(project_id=project.id.value)
-                .filter(~TodoModel.id.in_(existing_todo_ids))
-                .all()
-            )
-        else:
-            # If no todos exist in project, delete all todos for this project
-            todos_to_delete = (
-                self.session.query(TodoModel)
-                .filter_by(project_id=project.id.value)
-                .all()
-            )
+            # Update existing todo
+            existing_todo.project_id = todo_dto.project_id
+            existing_todo.title = todo_dto.title
+            existing_todo.description = todo_dto.description
+            existing_todo.status = todo_dto.status
+            existing_todo.dependencies = todo_dto.dependencies
+            existing_todo.updated_at = todo_dto.updated_at
+            existing_todo.completed_at = todo_dto.completed_at
 
-        for todo_to_delete in todos_to_delete:
+        self.session.add_all(new_todos)
+
+        # Remove todos that are no longer in the project
+        for todo_to_delete in existing_todos.values():
             self.session.delete(todo_to_delete)
 
     def delete(self, project_id: ProjectId) -> None:
@@ -0,0 +1,89 @@
+"""Fixtures shared by the whole test suite."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from dddpy.domain.shared.events import get_event_publisher
+from dddpy.infrastructure.sqlite.database import Base
+
+# Import all models so they are registered on Base.metadata before create_all
+from dddpy.infrastructure.sqlite.project.project_history_model import (  # noqa: F401
+    ProjectHistoryModel,
+)
+from dddpy.infrastructure.sqlite.project.project_model import (  # noqa: F401
+    ProjectModel,
+)
+from dddpy.infrastructure.sqlite.project.project_repository import (
+    new_project_repository,
+)
+from dddpy.infrastructure.sqlite.todo.todo_history_model import (  # noqa: F401
+    TodoHistoryModel,
+)
+from dddpy.infrastructure.sqlite.todo.todo_model import TodoModel  # noqa: F401
+
+# The publisher is a process-wide singleton, so it can be resolved once
+_EVENT_PUBLISHER = get_event_publisher()
+
+
+@pytest.fixture(autouse=True)
+def _reset_events():
+    """Start every test with an empty global event publisher."""
+    _EVENT_PUBLISHER.clear_events()
+    yield
+
+
+@pytest.fixture(scope='session')
+def test_engine():
+    """Provide one in-memory SQLite engine with all tables, shared by the session."""
+    # StaticPool keeps a single connection so every checkout sees the same DB
+    engine = create_engine(
+        'sqlite://',
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT-based rollback;
+    # let SQLAlchemy emit BEGIN itself instead.
+    @event.listens_for(engine, 'connect')
+    def _disable_pysqlite_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(connection):
+        connection.exec_driver_sql('BEGIN')
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def test_connection(test_engine):
+    """Provide a connection whose outer transaction is rolled back after the test."""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def test_session_factory(test_connection):
+    """Provide a session factory whose commits only release a SAVEPOINT."""
+    return sessionmaker(bind=test_connection, join_transaction_mode='create_savepoint')
+
+
+@pytest.fixture
+def test_session(test_session_factory):
+    """Provide a session that is closed after the test."""
+    session = test_session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def project_repository(test_session):
+    """Provide a SQLite ProjectRepository bound to the test session."""
+    return new_project_repository(test_session)
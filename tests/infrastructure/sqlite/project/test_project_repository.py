@@ -0,0 +1,191 @@
+"""Test cases for the SQLite ProjectRepository."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from dddpy.domain.project.entities.project import Project
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.project.project_model import ProjectModel
+from dddpy.infrastructure.sqlite.project.project_repository import (
+    _MAX_IDS_PER_QUERY,
+    new_project_repository,
+)
+from dddpy.infrastructure.sqlite.todo.todo_model import TodoModel
+
+
+def _todo_rows(session) -> list[TodoModel]:
+    """Return every persisted todo row, bypassing the repository."""
+    return list(session.scalars(select(TodoModel)).all())
+
+
+def test_save_inserts_project_with_todos(test_session, project_repository):
+    """Test saving a new project inserts the project and all of its todos."""
+    project = Project.create('Test Project')
+    todo1 = project.add_todo(TodoTitle('Todo 1'))
+    todo2 = project.add_todo(TodoTitle('Todo 2'))
+
+    project_repository.save(project)
+    test_session.commit()
+
+    found = project_repository.find_by_id(project.id)
+    assert found is not None
+    assert {t.id for t in found.todos} == {todo1.id, todo2.id}
+    assert {row.id for row in _todo_rows(test_session)} == {
+        todo1.id.value,
+        todo2.id.value,
+    }
+
+
+def test_save_updates_existing_todos_in_place(test_session, project_repository):
+    """Test saving again updates the existing todo row instead of inserting one."""
+    project = Project.create('Test Project')
+    todo = project.add_todo(TodoTitle('Original Title'))
+    project_repository.save(project)
+    test_session.commit()
+
+    project.update_todo_by_id(todo.id, title=TodoTitle('Updated Title'))
+    project.start_todo_by_id(todo.id)
+    project_repository.save(project)
+    test_session.commit()
+
+    rows = _todo_rows(test_session)
+    assert len(rows) == 1
+    assert rows[0].id == todo.id.value
+    assert rows[0].title == 'Updated Title'
+    assert rows[0].status == 'in_progress'
+
+
+def test_save_deletes_todos_removed_from_project(test_session, project_repository):
+    """Test saving after Project.remove_todo deletes the removed todo's row."""
+    project = Project.create('Test Project')
+    removed = project.add_todo(TodoTitle('Removed Todo'))
+    kept = project.add_todo(TodoTitle('Kept Todo'))
+    project_repository.save(project)
+    test_session.commit()
+
+    project.remove_todo(removed.id)
+    project_repository.save(project)
+    test_session.commit()
+
+    assert [row.id for row in _todo_rows(test_session)] == [kept.id.value]
+    found = project_repository.find_by_id(project.id)
+    assert found is not None
+    assert [t.id for t in found.todos] == [kept.id]
+
+
+def test_find_all_with_limit_loads_todos_of_listed_projects_only(
+    test_connection, test_session, project_repository
+):
+    """Test find_all(limit) returns the newest projects, each with its own todos."""
+    projects = []
+    for i in range(3):
+        project = Project.create(f'Project {i}')
+        project.add_todo(TodoTitle(f'Todo {i}'))
+        project_repository.save(project)
+        projects.append(project)
+    test_session.flush()
+    # Give each project a distinct creation time so the ordering is deterministic
+    for i, project in enumerate(projects):
+        test_session.execute(
+            update(ProjectModel)
+            .where(ProjectModel.id == project.id.value)
+            .values(created_at=i)
+        )
+    test_session.commit()
+
+    todo_selects: list[str] = []
+
+    def record_todo_select(conn, cursor, statement, *_):
+        if statement.lstrip().upper().startswith('SELECT') and 'FROM todo' in statement:
+            todo_selects.append(statement)
+
+    event.listen(test_connection, 'before_cursor_execute', record_todo_select)
+    try:
+        result = project_repository.find_all(limit=2)
+    finally:
+        event.remove(test_connection, 'before_cursor_execute', record_todo_select)
+
+    assert [p.id for p in result] == [projects[2].id, projects[1].id]
+    assert [[t.title.value for t in p.todos] for p in result] == [
+        ['Todo 2'],
+        ['Todo 1'],
+    ]
+    assert len(todo_selects) == 1
+
+
+def test_find_all_loads_todos_of_more_projects_than_one_id_chunk(
+    test_session, project_repository
+):
+    """Test find_all splits the project ids across todo queries without losing any."""
+    project_count = _MAX_IDS_PER_QUERY + 1
+    project_rows = [
+        {'id': uuid4(), 'name': f'Project {i}', 'created_at': i, 'updated_at': i}
+        for i in range(project_count)
+    ]
+    todo_rows = [
+        {
+            'id': uuid4(),
+            'project_id': project_row['id'],
+            'title': project_row['name'],
+            'status': 'not_started',
+            'dependencies': '',
+            'created_at': 0,
+            'updated_at': 0,
+        }
+        for project_row in project_rows
+    ]
+    test_session.execute(insert(ProjectModel), project_rows)
+    test_session.execute(insert(TodoModel), todo_rows)
+    test_session.commit()
+
+    result = project_repository.find_all()
+
+    assert len(result) == project_count
+    assert all(
+        [t.title.value for t in project.todos] == [project.name.value]
+        for project in result
+    )
+
+
+@pytest.mark.parametrize('limit', [None, 1])
+def test_find_all_ignores_projects_committed_between_its_queries(tmp_path, limit):
+    """Test find_all does not fail when another session commits mid-call."""
+    # A file-backed DB, so the second session really is a separate connection
+    engine = create_engine(f'sqlite:///{tmp_path / "test.db"}')
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    reader, writer = session_factory(), session_factory()
+    try:
+        project_repository = new_project_repository(reader)
+        existing = Project.create('Existing Project')
+        existing.add_todo(TodoTitle('Existing Todo'))
+        project_repository.save(existing)
+        reader.commit()
+
+        concurrent: list[Project] = []
+
+        def commit_from_writer_before_todo_select(orm_execute_state):
+            loads_todos = any(
+                mapper.class_ is TodoModel for mapper in orm_execute_state.all_mappers
+            )
+            if loads_todos and not concurrent:
+                project = Project.create('Concurrent Project')
+                project.add_todo(TodoTitle('Concurrent Todo'))
+                new_project_repository(writer).save(project)
+                writer.commit()
+                concurrent.append(project)
+
+        event.listen(reader, 'do_orm_execute', commit_from_writer_before_todo_select)
+        result = project_repository.find_all(limit=limit)
+
+        assert concurrent, 'the writer never committed between the two queries'
+        assert [p.id for p in result] == [existing.id]
+        assert [t.title.value for t in result[0].todos] == ['Existing Todo']
+    finally:
+        reader.close()
+        writer.close()
+        engine.dispose()
@@ -0,0 +1,15 @@
+"""Helpers shared by the integration tests."""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from dddpy.domain.shared.events import DomainEvent, DomainEventPublisher
+
+
+@contextmanager
+def new_events(
+    publisher: DomainEventPublisher,
+) -> Iterator[Callable[[], list[DomainEvent]]]:
+    """ブロック内で発行されたイベントだけを返す callable を yield する"""
+    n_before = publisher.pending_count()
+    yield lambda: publisher.get_events()[n_before:]
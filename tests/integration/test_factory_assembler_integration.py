@@ -14,6 +14,7 @@ from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.value_objects import TodoTitle, TodoDescription
 from dddpy.dto.todo import TodoCreateDto
 from dddpy.usecase.assembler import TodoCreateAssembler
+from tests.integration.helpers import new_events
 
 
 class TestFactoryAssemblerIntegration(unittest.TestCase):
@@ -29,9 +30,6 @@ class TestFactoryAssemblerIntegration(unittest.TestCase):
             event_publisher=get_event_publisher(),
         )
 
-        # Clear any existing events after project creation
-        get_event_publisher().clear_events()
-
     def test_assembler_to_factory_to_project_flow(self):
         """Assembler → Factory → Project 統合フロー"""
         # 1. DTOからAssemblerでエンティティ作成
@@ -56,24 +54,22 @@ class TestFactoryAssemblerIntegration(unittest.TestCase):
         description = TodoDescription('Event Test Description')
 
         # Todo.createでTodo作成（イベント発行付き）
-        todo = Todo.create(
-            title=title,
-            project_id=self.project.id,
-            description=description,
-            event_publisher=get_event_publisher(),
-        )
+        with new_events(get_event_publisher()) as since:
+            todo = Todo.create(
+                title=title,
+                project_id=self.project.id,
+                description=description,
+                event_publisher=get_event_publisher(),
+            )
 
         # TodoCreatedイベントが発行されていることを確認
-        events = get_event_publisher().get_events()
+        events = since()
         self.assertEqual(len(events), 1)
         self.assertEqual(events[0].event_type, 'TodoCreated')
         self.assertEqual(events[0].todo_id, todo.id.value)
 
     def test_project_add_todo_entity_publishes_event(self):
         """Project.add_todo_entity使用時のイベント発行確認"""
-        # Clear events first
-        get_event_publisher().clear_events()
-
         # Todoを作成
         title = TodoTitle('Project Event Test')
         todo = Todo.create(
@@ -82,14 +78,12 @@ class TestFactoryAssemblerIntegration(unittest.TestCase):
             event_publisher=get_event_publisher(),
         )
 
-        # Clear TodoCreated event
-        get_event_publisher().clear_events()
-
-        # ProjectにTodoを追加
-        self.project.add_todo_entity(todo)
+        # ProjectにTodoを追加（TodoCreated はスナップショット外）
+        with new_events(get_event_publisher()) as since:
+            self.project.add_todo_entity(todo)
 
         # TodoAddedToProjectイベントが発行されていることを確認
-        events = get_event_publisher().get_events()
+        events = since()
         self.assertEqual(len(events), 1)
         self.assertEqual(events[0].event_type, 'TodoAddedToProject')
         self.assertEqual(events[0].project_id, self.project.id.value)
@@ -97,30 +91,25 @@ class TestFactoryAssemblerIntegration(unittest.TestCase):
 
     def test_full_integration_with_multiple_events(self):
         """完全統合テスト：複数イベント発行"""
-        get_event_publisher().clear_events()
-
         # 1. DTOからTodo作成
         dto = TodoCreateDto(title='Full Integration Todo')
 
-        # TodoCreateAssemblerでTodo作成
-        title_vo = TodoTitle(dto.title)
-        todo = Todo.create(
-            title=title_vo,
-            project_id=self.project.id,
-            event_publisher=get_event_publisher(),
-        )
+        with new_events(get_event_publisher()) as since:
+            # TodoCreateAssemblerでTodo作成
+            title_vo = TodoTitle(dto.title)
+            todo = Todo.create(
+                title=title_vo,
+                project_id=self.project.id,
+                event_publisher=get_event_publisher(),
+            )
 
-        # 2. ProjectにTodo追加
-        self.project.add_todo_entity(todo)
+            # 2. ProjectにTodo追加
+            self.project.add_todo_entity(todo)
 
         # 3. 両方のイベントが発行されていることを確認
-        events = get_event_publisher().get_events()
+        events = since()
         self.assertEqual(len(events), 2)  # TodoCreated + TodoAddedToProject
 
         event_types = [event.event_type for event in events]
         self.assertIn('TodoCreated', event_types)
         self.assertIn('TodoAddedToProject', event_types)
-
-
-if __name__ == '__main__':
-    unittest.main()
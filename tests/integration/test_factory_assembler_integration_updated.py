@@ -15,6 +15,7 @@ from dddpy.domain.todo.value_objects import TodoTitle, TodoDescription
 from dddpy.dto.todo import TodoCreateDto
 from dddpy.dto.project import AddTodoToProjectDto
 from dddpy.usecase.assembler import TodoCreateAssembler
+from tests.integration.helpers import new_events
 
 
 class TestFactoryAssemblerIntegrationUpdated(unittest.TestCase):
@@ -30,9 +31,6 @@ class TestFactoryAssemblerIntegrationUpdated(unittest.TestCase):
             event_publisher=get_event_publisher(),
         )
 
-        # Clear any existing events after project creation
-        get_event_publisher().clear_events()
-
     def test_assembler_with_todo_create_dto(self):
         """TodoCreateDto使用の統合フロー"""
         # 1. TodoCreateDtoからAssemblerでエンティティ作成
@@ -68,26 +66,27 @@ class TestFactoryAssemblerIntegrationUpdated(unittest.TestCase):
 
     def test_event_aware_assembler_with_add_todo_dto(self):
         """Todo.create + AddTodoToProjectDto統合テスト"""
-        get_event_publisher().clear_events()
-
         # AddTodoToProjectDtoを直接使用
         dto = AddTodoToProjectDto(
             title='Event Aware Test', description='Test Description'
         )
 
-        # Todoを直接作成
-        todo = Todo.create(
-            title=TodoTitle(dto.title),
-            project_id=self.project.id,
-            description=TodoDescription(dto.description) if dto.description else None,
-            event_publisher=get_event_publisher(),
-        )
+        with new_events(get_event_publisher()) as since:
+            # Todoを直接作成
+            todo = Todo.create(
+                title=TodoTitle(dto.title),
+                project_id=self.project.id,
+                description=TodoDescription(dto.description)
+                if dto.description
+                else None,
+                event_publisher=get_event_publisher(),
+            )
 
-        # ProjectにTodo追加
-        self.project.add_todo_entity(todo)
+            # ProjectにTodo追加
+            self.project.add_todo_entity(todo)
 
         # 両方のイベントが発行されていることを確認
-        events = get_event_publisher().get_events()
+        events = since()
         self.assertEqual(len(events), 2)
 
         event_types = [event.event_type for event in events]
@@ -96,8 +95,6 @@ class TestFactoryAssemblerIntegrationUpdated(unittest.TestCase):
 
     def test_protocol_compatibility(self):
         """Protocol互換性テスト - 同じAssemblerで異なるDTOを処理"""
-        get_event_publisher().clear_events()
-
         # TodoCreateDto
         todo_dto = TodoCreateDto(title='Protocol Test 1')
         todo1 = TodoCreateAssembler.to_entity(todo_dto, str(self.project.id.value))
@@ -111,7 +108,3 @@ class TestFactoryAssemblerIntegrationUpdated(unittest.TestCase):
         self.assertEqual(todo2.title.value, 'Protocol Test 2')
         self.assertEqual(todo1.project_id, self.project.id)
         self.assertEqual(todo2.project_id, self.project.id)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -0,0 +1,30 @@
+"""Test doubles and fixed ids shared by the use case tests."""
+
+from dataclasses import dataclass, field
+
+from dddpy.domain.project.entities.project import Project
+
+# Well-formed ids that never belong to a saved project or todo
+NONEXISTENT_PROJECT_ID = '550e8400-e29b-41d4-a716-446655440000'
+NONEXISTENT_TODO_ID = '550e8400-e29b-41d4-a716-446655440001'
+
+
+@dataclass
+class FakeProjectRepository:
+    """Hand-rolled repository fake recording the calls use case tests check."""
+
+    project: Project | None = None
+    saved: list[Project] = field(default_factory=list)
+    find_calls: int = 0
+    find_all_calls: int = 0
+
+    def find_by_id(self, _project_id):
+        self.find_calls += 1
+        return self.project
+
+    def find_all(self, limit=None):
+        self.find_all_calls += 1
+        return [self.project] if self.project else []
+
+    def save(self, project):
+        self.saved.append(project)
@@ -0,0 +1,18 @@
+"""Fixtures for SQLite-backed project use case tests."""
+
+import pytest
+
+from dddpy.domain.shared.events import get_event_publisher
+from dddpy.dto.project import ProjectCreateDto, ProjectOutputDto
+from dddpy.usecase.project import new_create_project_usecase
+
+
+@pytest.fixture
+def test_project(test_session, project_repository) -> ProjectOutputDto:
+    """Persist a single project through the create use case."""
+    usecase = new_create_project_usecase(project_repository, get_event_publisher())
+    project = usecase.execute(
+        ProjectCreateDto(name='Test Project', description='Test Description')
+    )
+    test_session.commit()
+    return project
@@ -0,0 +1,25 @@
+"""Test cases for CreateProjectUseCase backed by the SQLite repository."""
+
+import pytest
+
+from dddpy.domain.shared.events import get_event_publisher
+from dddpy.dto.project import ProjectCreateDto
+from dddpy.usecase.project import new_create_project_usecase
+
+
+def test_create_project_with_unique_name(project_repository, test_project):
+    """Test creating a project whose name is not taken yet."""
+    usecase = new_create_project_usecase(project_repository, get_event_publisher())
+
+    result = usecase.execute(ProjectCreateDto(name='Another Project'))
+
+    assert result.name == 'Another Project'
+    assert result.id != test_project.id
+
+
+def test_create_project_with_duplicate_name_fails(project_repository, test_project):
+    """Test creating a project with an existing name raises ValueError."""
+    usecase = new_create_project_usecase(project_repository, get_event_publisher())
+
+    with pytest.raises(ValueError, match="'Test Project' already exists"):
+        usecase.execute(ProjectCreateDto(name=test_project.name))
@@ -0,0 +1,144 @@
+"""Test cases for FindProjectsUseCase backed by the SQLite repository."""
+
+import time
+from uuid import uuid4
+
+from sqlalchemy import event, func, insert, select
+
+from dddpy.domain.shared.events import get_event_publisher
+from dddpy.dto.project import AddTodoToProjectDto
+from dddpy.infrastructure.sqlite.project.project_history_model import (
+    ProjectHistoryModel,
+)
+from dddpy.infrastructure.sqlite.project.project_model import ProjectModel
+from dddpy.infrastructure.sqlite.todo.todo_model import TodoModel
+from dddpy.usecase.project import (
+    new_add_todo_to_project_usecase,
+    new_find_projects_usecase,
+)
+
+# One query for the projects and one for all of their todos
+EXPECTED_SELECTS = 2
+
+
+def _seed_projects(session, n: int) -> None:
+    """Insert n projects with one todo each, bypassing the use cases."""
+    now = int(time.time() * 1000)
+    project_rows = [
+        {
+            'id': uuid4(),
+            'name': f'Project {i}',
+            'description': None,
+            'created_at': now + i,
+            'updated_at': now + i,
+        }
+        for i in range(n)
+    ]
+    todo_rows = [
+        {
+            'id': uuid4(),
+            'project_id': project_row['id'],
+            'title': f'Todo {i}',
+            'description': None,
+            'status': 'not_started',
+            'dependencies': '',
+            'created_at': now,
+            'updated_at': now,
+            'completed_at': None,
+        }
+        for i, project_row in enumerate(project_rows)
+    ]
+    session.execute(insert(ProjectModel), project_rows)
+    session.execute(insert(TodoModel), todo_rows)
+    session.commit()
+
+
+def test_find_projects_returns_empty_list(project_repository):
+    """Test finding projects when none have been saved."""
+    usecase = new_find_projects_usecase(project_repository)
+
+    assert usecase.execute() == []
+
+
+def test_find_projects_returns_saved_project(project_repository, test_project):
+    """Test finding a project that was saved through the create use case."""
+    usecase = new_find_projects_usecase(project_repository)
+    result = usecase.execute()
+
+    assert len(result) == 1
+    assert result[0].id == test_project.id
+    assert result[0].name == 'Test Project'
+    assert result[0].description == 'Test Description'
+    assert result[0].todos == []
+
+
+def test_find_projects_includes_todos(test_session, project_repository, test_project):
+    """Test that todos added to a project are returned with it."""
+    add_todo_usecase = new_add_todo_to_project_usecase(project_repository)
+    todo = add_todo_usecase.execute(
+        test_project.id, AddTodoToProjectDto(title='Test Todo')
+    )
+    test_session.commit()
+
+    result = new_find_projects_usecase(project_repository).execute()
+
+    assert len(result) == 1
+    assert [t.id for t in result[0].todos] == [todo.id]
+    assert result[0].todos[0].title == 'Test Todo'
+    assert result[0].todos[0].status == 'not_started'
+
+
+def test_find_projects_includes_multiple_todos(
+    test_session, project_repository, test_project
+):
+    """Test that every todo saved across several additions is returned."""
+    add_todo_usecase = new_add_todo_to_project_usecase(project_repository)
+    titles = ['Todo 1', 'Todo 2', 'Todo 3']
+    for title in titles:
+        add_todo_usecase.execute(test_project.id, AddTodoToProjectDto(title=title))
+    test_session.commit()
+
+    result = new_find_projects_usecase(project_repository).execute()
+
+    assert sorted(t.title for t in result[0].todos) == titles
+
+
+def test_find_projects_loads_todos_in_fixed_number_of_queries(
+    test_connection, test_session, project_repository
+):
+    """Test that todos are not loaded with one query per project (N+1)."""
+    project_count = 5
+    _seed_projects(test_session, project_count)
+
+    selects: list[str] = []
+
+    def record_select(conn, cursor, statement, *_):
+        if statement.lstrip().upper().startswith('SELECT'):
+            selects.append(statement)
+
+    event.listen(test_connection, 'before_cursor_execute', record_select)
+    try:
+        result = new_find_projects_usecase(project_repository).execute()
+    finally:
+        event.remove(test_connection, 'before_cursor_execute', record_select)
+
+    assert len(result) == project_count
+    assert all(len(project.todos) == 1 for project in result)
+    assert len(selects) == EXPECTED_SELECTS
+
+
+def test_find_projects_does_not_publish_events_or_write_history(
+    test_session, project_repository, test_project
+):
+    """Test that finding projects is free of side effects."""
+    publisher = get_event_publisher()
+    events_before = publisher.pending_count()
+
+    new_find_projects_usecase(project_repository).execute()
+
+    assert publisher.pending_count() == events_before
+    history_count = test_session.execute(
+        select(func.count()).select_from(ProjectHistoryModel)
+    ).scalar_one()
+    # Only the history row written when test_project was created
+    assert history_count == 1